@@ -1,22 +1,46 @@
-from typing import Union, Optional, List, Dict
+import sys
+from typing import Union, Optional, List, Dict, Tuple, FrozenSet, Iterable
+
+# Valid grades that can be assigned to an enrollment
+_VALID_GRADES: FrozenSet[str] = frozenset({'A', 'B', 'C', 'D', 'E', 'F'})
 
 class Person:
     """
     Represents a person with a name and an ID number.
     """
 
+    __slots__ = ('name', 'id_number')
+
     def __init__(self, name: str, id_number: str) -> None:
         """
         Initializes a Person instance with a name and an ID number.
+
+        An ID number of exact type str is interned so that ID lookups and comparisons 
+        can short-circuit on identity. Any other ID (e.g. an int or a str subclass) 
+        is stored as given.
         """
         self.name: str = name
-        self.id_number: str = id_number
+        self.id_number: str = sys.intern(id_number) if type(id_number) is str else id_number
 
     def __str__(self) -> str:
         """
         A string representation of a person's details
         """
         return f"ID: {self.id_number} Name: {self.name}"
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Two people are equal if they are of the same type and have the same ID number
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id_number == other.id_number
+
+    def __hash__(self) -> int:
+        """
+        A hash of the person's ID number, consistent with __eq__
+        """
+        return hash(self.id_number)
     
 
 class Student(Person):
@@ -24,15 +48,24 @@ class Student(Person):
     Represents a student (inherits from the Person class) in a Student Management System
     """
 
+    __slots__ = ('major', 'courses', '_courses_snapshot')
+
+    # Padded labels used by __str__
+    _ID_LBL: str = f"{'ID:':>7}"
+    _NAME_LBL: str = f"{'Name:':>7}"
+    _MAJOR_LBL: str = f"{'Major:':>7}"
+
     def __init__(self, name: str, id_number: str, major: str) -> None:
         """
         Initializes a Student instance with a name, ID number, Major, and a dictionary of enrolled courses.
         """
         super().__init__(name, id_number)
         self.major: str = major
-        # Initializes an empty dictionary where the keys are Course objects
-        # and the values are optional grade
-        self.courses: Dict[Course, Optional[str]] = {}
+        # Initializes an empty dictionary where the keys are course IDs
+        # and the values are (Course, optional grade) pairs
+        self.courses: Dict[str, Tuple[Course, Optional[str]]] = {}
+        # Cached tuple of enrolled courses, cleared whenever a course is added
+        self._courses_snapshot: Optional[Tuple[Course, ...]] = None
         
 
     def add_course(self, enrol: 'Enrollment') -> None:
@@ -48,14 +81,38 @@ class Student(Person):
             the student, course, and grade information.
         """
         if self.id_number == enrol.student.id_number:
-            self.courses[enrol.course] = enrol.grade
+            self.courses[enrol.course.course_id] = (enrol.course, enrol.grade)
+            self._courses_snapshot = None
+
+    def bulk_add_courses(self, courses: Iterable['Course']) -> None:
+        """
+        Adds many courses to the student's course list in a single update, with no grade.
+
+        This method is used for bulk imports in place of calling `add_course` once per 
+        enrollment. Courses already in the student's course list are left unchanged, 
+        so their grades are kept.
+
+        Args:
+            courses (Iterable[Course]): The courses the student is enrolled in.
+        """
+        self.courses.update({crs.course_id: (crs, None) for crs in courses if crs.course_id not in self.courses})
+        self._courses_snapshot = None
+
+    @property
+    def courses_snapshot(self) -> Tuple['Course', ...]:
+        """
+        A cached tuple of the courses the student is enrolled in, rebuilt only after a course is added
+        """
+        if self._courses_snapshot is None:
+            self._courses_snapshot = tuple(crs for crs, _ in self.courses.values())
+        return self._courses_snapshot
 
 
     def __str__(self) -> str:
         """
         A string representation of the student's details
         """
-        return f"{'ID:':>7} {self.id_number}\n{'Name:':>7} {self.name}\n{'Major:':>7} {self.major}"
+        return f"{self._ID_LBL} {self.id_number}\n{self._NAME_LBL} {self.name}\n{self._MAJOR_LBL} {self.major}"
     
     def __repr__(self) -> str:
         """
@@ -69,6 +126,13 @@ class Instructor(Person):
     Represents an Instructor (inherits from the Person class) in a Student Management System
     """
 
+    __slots__ = ('department',)
+
+    # Padded labels used by __str__
+    _ID_LBL: str = f"{'ID:':>12}"
+    _NAME_LBL: str = f"{'Name:':>12}"
+    _DEPARTMENT_LBL: str = f"{'Department:':>12}"
+
     def __init__(self, name: str, id_number: str, department: str) -> None:
         """
         Initializes an Instructor instance with a name, ID number, and Department.
@@ -80,7 +144,7 @@ class Instructor(Person):
         """
         A string representation of an Instructor's details
         """
-        return f"{'ID:':>12} {self.id_number}\n{'Name:':>12} {self.name}\n{'Department:':>12} {self.department}"
+        return f"{self._ID_LBL} {self.id_number}\n{self._NAME_LBL} {self.name}\n{self._DEPARTMENT_LBL} {self.department}"
     
 
 class Course:
@@ -88,20 +152,48 @@ class Course:
     Represents a Course in a Student Management System
     """
 
+    __slots__ = ('course_name', 'course_id', 'enrolled_students', '_students_snapshot')
+
+    # Padded labels used by __str__
+    _ID_LBL: str = f"{'ID:':>18}"
+    _NAME_LBL: str = f"{'Course Name:':>18}"
+    _ENROLLED_LBL: str = f"{'Enrolled Students:':>18}"
+
     def __init__(self, course_name: str, course_id: str, enrolled_students: Optional[List[Student]] = None) -> None:
         """
         Initializes a Course instance with a Course name, ID number, and Enrolled Student.
+        A course ID of exact type str is interned so that ID lookups and comparisons can 
+        short-circuit on identity. Any other ID (e.g. an int or a str subclass) is stored as given.
         """
         self.course_name: str = course_name
-        self.course_id: str = course_id
+        self.course_id: str = sys.intern(course_id) if type(course_id) is str else course_id
+        # Enrolled students are keyed by their ID number
         if enrolled_students is not None:
-            self.enrolled_students: List[Student] = enrolled_students
+            self.enrolled_students: Dict[str, Student] = {std.id_number: std for std in enrolled_students}
         else:
-            self.enrolled_students: List[Student] = []
+            self.enrolled_students: Dict[str, Student] = {}
+        # Cached tuple of enrolled students, cleared whenever the enrollment changes
+        self._students_snapshot: Optional[Tuple[Student, ...]] = None
+
+    @property
+    def students_list(self) -> List[Student]:
+        """
+        A list of the students enrolled in the course, in enrollment order
+        """
+        return list(self.enrolled_students.values())
+
+    @property
+    def students_snapshot(self) -> Tuple[Student, ...]:
+        """
+        A cached tuple of the students enrolled in the course, rebuilt only after the enrollment changes
+        """
+        if self._students_snapshot is None:
+            self._students_snapshot = tuple(self.enrolled_students.values())
+        return self._students_snapshot
 
     def enrollment(self, enrol: "Enrollment") -> None:
         """
-        Adds a student to the course's list of enrolled students if the course 
+        Adds a student to the course's enrolled students if the course 
         in the Enrollment matches this course.
         
         Args:
@@ -109,20 +201,34 @@ class Course:
             the student and course information.
         """
         if self.course_id == enrol.course.course_id:
-            self.enrolled_students.append(enrol.student)
+            self.enrolled_students[enrol.student.id_number] = enrol.student
+            self._students_snapshot = None
+
+    def bulk_enroll(self, students: Iterable[Student]) -> None:
+        """
+        Adds many students to the course's enrolled students in a single update.
+
+        This method is used for bulk imports in place of calling `enrollment` once per 
+        enrolled student.
+
+        Args:
+            students (Iterable[Student]): The students to be enrolled in the course.
+        """
+        self.enrolled_students.update({std.id_number: std for std in students})
+        self._students_snapshot = None
 
     def add_student(self, student: Student) -> None:
         """
         Adds a student to the course if they are not already enrolled.
 
         This method checks whether the student is already enrolled in the course. 
-        If the student is found in the list of enrolled students, a ValueError is raised. 
+        If the student's ID is found among the enrolled students, a ValueError is raised. 
         Otherwise, the student is enrolled in the course.
 
         Args:
             student (Student): The student to be added to the course.
         """
-        if student in self.enrolled_students:
+        if student.id_number in self.enrolled_students:
             raise ValueError(f'Student ID {student.id_number} is already enrolled in course {self.course_name}')
         Enrollment(student, self)
 
@@ -130,40 +236,45 @@ class Course:
         """
         Finds a student enrolled in the course by their student ID.
 
-        This method searches through the list of enrolled students and returns the matching 
+        This method looks up the enrolled students by ID and returns the matching 
         student object. If no student with the given ID is found, it returns None.
 
         Args:
             student_id (str): The ID of the student to search for.
         """
-        for std in self.enrolled_students:
-            if std.id_number == student_id:
-                return std
-        return None
+        return self.enrolled_students.get(student_id)
 
     def remove_student(self, student_id: str) -> None:
         """
         Removes a student from the course by their student ID.
 
-        This method finds the student enrolled in the course using the `find_enrolled_student` 
-        method, and if the student is found, removes them from the list of enrolled students.
+        If a student with the given ID is enrolled in the course, they are removed 
+        from the enrolled students. Otherwise, nothing happens.
         
         Args:
             student_id (str): The ID of the student to be removed.
         """
-        std_enrolled = self.find_enrolled_student(student_id)
-        if std_enrolled:
-            self.enrolled_students.remove(std_enrolled)
+        if self.enrolled_students.pop(student_id, None) is not None:
+            self._students_snapshot = None
 
     def __str__(self) -> str:
         """
-        A string representation of a Course details
+        A string representation of a Course details, showing only the number of enrolled students
         """
-        # return f"{'ID:':>19} {self.course_id}\n{'Course Name:':>19} {self.course_name}\n{'Enrolled Students:':>19} {self.enrolled_students}"
         return (
-        f"{'ID:':>18} {self.course_id}\n"
-        f"{'Course Name:':>18} {self.course_name}\n"
-        f"{'Enrolled Students:':>18} {self.enrolled_students}"
+        f"{self._ID_LBL} {self.course_id}\n"
+        f"{self._NAME_LBL} {self.course_name}\n"
+        f"{self._ENROLLED_LBL} {len(self.enrolled_students)} enrolled"
+        )
+
+    def full_str(self) -> str:
+        """
+        A string representation of a Course details, listing every enrolled student
+        """
+        return (
+        f"{self._ID_LBL} {self.course_id}\n"
+        f"{self._NAME_LBL} {self.course_name}\n"
+        f"{self._ENROLLED_LBL} {self.students_list}"
         )
     
     def __repr__(self) -> str:
@@ -171,6 +282,20 @@ class Course:
         A formal string representation of the course ID and name
         """
         return f"({self.course_id} - {self.course_name})"
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Two courses are equal if they have the same course ID
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.course_id == other.course_id
+
+    def __hash__(self) -> int:
+        """
+        A hash of the course ID, consistent with __eq__
+        """
+        return hash(self.course_id)
     
 
 class Enrollment:
@@ -178,6 +303,12 @@ class Enrollment:
     Represents an enrollment of a student in a course within a Student Management System.
     """
 
+    __slots__ = ('student', 'course', 'grade')
+
+    # Padded labels used by __str__
+    _COURSE_LBL: str = f"{'Course:':>8}"
+    _STUDENT_LBL: str = f"{'Student:':>8}"
+
     def __init__(self, student: Student, course: Course, grade: Optional[str] = None) -> None:
         """
         Initializes an Enrollment instance with a student, course, and optional grade.
@@ -199,27 +330,40 @@ class Enrollment:
         Assigns a grade to a student enrolled in a course
 
         This method validates the grade against a predefined grading system 
-        (['A', 'B', 'C', 'D', 'E', 'F']). If the grade is valid, it assigns it 
+        (A, B, C, D, E, F). If the grade is valid, it assigns it 
         to the student. Otherwise, it raises a ValueError. 
         """
-        grade_system: List[str] = ['A', 'B', 'C', 'D', 'E', 'F']
-        if grade in grade_system:
-            self.grade = grade
-            self.student.courses[self.course] = grade
-        else:
+        if grade not in _VALID_GRADES:
             raise ValueError('Invalid grading system')
+        self.grade = grade
+        self.student.courses[self.course.course_id] = (self.course, grade)
 
     def __str__(self) -> str:
         """
         A string representation of enrollment details
         """
-        return f"{'Course:':>8} {self.course.course_name}\n{'Student:':>8} {self.student.name}"
+        return f"{self._COURSE_LBL} {self.course.course_name}\n{self._STUDENT_LBL} {self.student.name}"
     
     def __repr__(self) -> str:
         """
         A formal string representation of enrollment details
         """
         return f"({self.course.course_name}, {self.student.name}, {self.grade})"
+
+    @classmethod
+    def _from_linked(cls, student: Student, course: Course) -> 'Enrollment':
+        """
+        Creates an Enrollment, with no grade, for a student and course that have already been 
+        linked to each other (e.g. by `StudentManagementSystem.bulk_load`).
+
+        Unlike initialization, the course's `enrollment` method and the student's `add_course` 
+        method are not called.
+        """
+        enrol = cls.__new__(cls)
+        enrol.student = student
+        enrol.course = course
+        enrol.grade = None
+        return enrol
     
 
 class StudentManagementSystem:
@@ -229,42 +373,50 @@ class StudentManagementSystem:
 
     def __init__(self) -> None:
         """
-        Initializes the StudentManagementSystem with empty lists for 
-        students, instructors, courses, and enrollments.
+        Initializes the StudentManagementSystem with empty dictionaries of students, 
+        instructors, and courses keyed by their IDs, an empty list of enrollments, 
+        and an empty enrollment index keyed by (course ID, student ID). Enrollments 
+        loaded by `bulk_load` are kept as pending (student, course) pairs until 
+        they are first looked up with `find_enrollment`.
+
+        Note that `enrollments` and `enrollment_index` only hold `Enrollment` objects 
+        that have been created. A pending enrollment is added to them when it is first 
+        looked up, so it appears in `enrollments` in lookup order, not load order.
         """
-        self.students: List[Student] = []
-        self.instructors: List[Instructor] = []
-        self.courses: List[Course] = []
+        self.students: Dict[str, Student] = {}
+        self.instructors: Dict[str, Instructor] = {}
+        self.courses: Dict[str, Course] = {}
         self.enrollments: List[Enrollment] = []
+        self.enrollment_index: Dict[Tuple[str, str], Enrollment] = {}
+        self._pending_enrollments: Dict[Tuple[str, str], Tuple[Student, Course]] = {}
 
     def add_student(self, student: Student) -> None:
         """
         Adds a student to the student management system.
 
-        This method checks if the student is not already in the list of students. 
-        If the student is not present, it appends the student to the list.
+        The student is stored under their ID number. If a student with the same 
+        ID is already in the system, the existing record is kept.
 
         Args:
             student (Student): The student to be added to the system.
         """
-        if student not in self.students:
-            self.students.append(student)
+        self.students.setdefault(student.id_number, student)
 
     def find_student(self, student_id: str) -> Student:
         """
         Finds and returns a student by their ID number.
 
-        This method iterates through the list of students to find a match for 
-        the given student ID. If a student with the specified ID is found, 
-        the student object is returned. Otherwise, it returns None.
+        This method looks up the given student ID in the students dictionary. 
+        If a student with the specified ID is found, the student object is returned. 
+        Otherwise, it raises a ValueError.
 
         Args:
             student_id (str): The ID number of the student to find.
         """
-        for std in self.students:
-            if std.id_number == student_id:
-                return std
-        raise ValueError(f'No student record found for ID: {student_id}')
+        try:
+            return self.students[student_id]
+        except KeyError:
+            raise ValueError(f'No student record found for ID: {student_id}') from None
 
     def remove_student(self, student_id: str) -> None:
         """
@@ -272,13 +424,13 @@ class StudentManagementSystem:
 
         This method first attempts to find a student with the given ID using 
         the `find_student` method. If the student is found, they are removed 
-        from the list of students.
+        from the students dictionary.
 
         Args:
             student_id (str): The ID number of the student to be removed.
         """
         std = self.find_student(student_id)
-        self.students.remove(std)
+        del self.students[std.id_number]
 
     def update_student(self, student_id: str, name: Optional[str] = None, major: Optional[str] = None) -> None:
         """
@@ -303,30 +455,29 @@ class StudentManagementSystem:
         """
         Adds an instructor to the student management system.
 
-        This method checks if the instructor is not already in the list of instructors. 
-        If the instructor is not present, it appends the instructor to the list.
+        The instructor is stored under their ID number. If an instructor with the same 
+        ID is already in the system, the existing record is kept.
 
         Args:
             instructor (Instructor): The instructor to be added to the system.
         """
-        if instructor not in self.instructors:
-            self.instructors.append(instructor)
+        self.instructors.setdefault(instructor.id_number, instructor)
 
     def find_instructor(self, instructor_id: str) -> Instructor:
         """
         Finds and returns an instructor by their ID number.
 
-        This method iterates through the list of instructors to find a match for 
-        the given instructor ID. If an instructor with the specified ID is found, 
-        the instructor object is returned. Otherwise, it returns None.
+        This method looks up the given instructor ID in the instructors dictionary. 
+        If an instructor with the specified ID is found, the instructor object is returned. 
+        Otherwise, it raises a ValueError.
 
         Args:
             instructor_id (str): The ID number of the instructor to find.
         """
-        for inst in self.instructors:
-            if inst.id_number == instructor_id:
-                return inst        
-        raise ValueError(f'No instructor record found for ID: {instructor_id}')
+        try:
+            return self.instructors[instructor_id]
+        except KeyError:
+            raise ValueError(f'No instructor record found for ID: {instructor_id}') from None
 
     def remove_instructor(self, instructor_id: str) -> None:
         """
@@ -334,13 +485,13 @@ class StudentManagementSystem:
 
         This method first attempts to find an instructor with the given ID using 
         the `find_instructor` method. If the instructor is found, they are removed 
-        from the list of instructors.
+        from the instructors dictionary.
 
         Args:
             instructor_id (str): The ID number of the instructor to be removed.
         """
         inst_obj = self.find_instructor(instructor_id)
-        self.instructors.remove(inst_obj)
+        del self.instructors[inst_obj.id_number]
 
     def update_instructor(self, instructor_id: str, name: Optional[str]=None, department: Optional[str]=None) -> None:
         """
@@ -365,30 +516,28 @@ class StudentManagementSystem:
         """
         Adds a course to the system.
 
-        This method checks if the given course is already in the list of courses.
-        If the course is not in the list, it is added to the system.
+        The course is stored under its course ID. If a course with the same ID 
+        is already in the system, the existing record is kept.
 
         Args:
             course (Course): The course to be added to the system.
         """
-        if course not in self.courses:
-            self.courses.append(course)
+        self.courses.setdefault(course.course_id, course)
 
     def find_course(self, course_id: str) -> Course:
         """
         Finds a course in the system by its course ID.
 
-        This method searches through the list of courses to find a course that matches 
-        the given course ID. If a matching course is found, it is returned; otherwise, 
-        None is returned.
+        This method looks up the given course ID in the courses dictionary. 
+        If a matching course is found, it is returned; otherwise, a ValueError is raised.
 
         Args:
             course_id (str): The ID of the course to find.
         """
-        for crs in self.courses:
-            if crs.course_id == course_id:
-                return crs        
-        raise ValueError(f'No course record found for ID: {course_id}')
+        try:
+            return self.courses[course_id]
+        except KeyError:
+            raise ValueError(f'No course record found for ID: {course_id}') from None
 
         
     def remove_course(self, course_id: str) -> None:
@@ -396,13 +545,13 @@ class StudentManagementSystem:
         Removes a course from the system by its course ID.
 
         This method first finds the course with the specified ID using the `find_course` method. 
-        If the course is found, it is removed from the list of courses.
+        If the course is found, it is removed from the courses dictionary.
 
         Args:
             course_id (str): The ID of the course to be removed.
         """
         course_found = self.find_course(course_id)
-        self.courses.remove(course_found)
+        del self.courses[course_found.course_id]
 
     def update_course(self, course_id: str, course_name: Optional[str]=None) -> None:
         """
@@ -418,14 +567,32 @@ class StudentManagementSystem:
         if course_name is not None:
             course_found.course_name = course_name
 
+    def enroll(self, student: Student, course: Course) -> Enrollment:
+        """
+        Enrolls a student object in a course object.
+
+        This method creates an `Enrollment` instance for the given student and course 
+        and adds it to the list of enrollments and to the enrollment index. It skips the 
+        ID lookups, for callers that already hold the student and course objects.
+
+        Args:
+            student (Student): The student to be enrolled.
+            course (Course): The course in which the student should be enrolled.
+        """
+        key = (course.course_id, student.id_number)
+        enrol_obj = Enrollment(student, course)
+        self.enrollments.append(enrol_obj)
+        self.enrollment_index[key] = enrol_obj
+        self._pending_enrollments.pop(key, None)
+        return enrol_obj
+
     def enroll_student(self, student_id: str, course_id: str) -> None:
         """
         Enrolls a student in a course.
 
         This method first finds the student by their ID using the `find_student` method. 
         Then, finds the corresponding course using the `find_course` method 
-        and creates an `Enrollment` instance.
-        The created enrollment instance is then added to the list of enrollments.
+        and enrolls the student using the `enroll` method.
 
         Args:
             student_id (str): The ID of the student to be enrolled.
@@ -433,24 +600,118 @@ class StudentManagementSystem:
         """
         student_found = self.find_student(student_id)
         course_found = self.find_course(course_id)
-        enrol_obj = Enrollment(student_found, course_found)
-        self.enrollments.append(enrol_obj)
+        self.enroll(student_found, course_found)
+
+    def bulk_load(self, students: Iterable[Tuple[str, str, str]] = (), courses: Iterable[Tuple[str, str]] = (), 
+                  enrollments: Iterable[Tuple[str, str]] = ()) -> None:
+        """
+        Loads students, courses, and enrollments into the system in a single pass.
+
+        Students and courses are given as rows of their constructor arguments, 
+        (name, id_number, major) and (course_name, course_id) respectively, and are 
+        added with the same rules as `add_student` and `add_course`. Enrollments are 
+        given as (student_id, course_id) rows; they are grouped by course so that each 
+        course is looked up only once, and each group is then enrolled together using 
+        `Course.bulk_enroll` and `Student.bulk_add_courses`.
+
+        Every enrollment row is checked against the existing records and the rows being 
+        added before anything is changed, so if a student or course ID cannot be found, 
+        a ValueError is raised and the system is left as it was.
+
+        No `Enrollment` objects are created here. Each loaded enrollment is recorded 
+        as pending and its `Enrollment` is created by `find_enrollment` the first time 
+        it is needed, e.g. when a grade is assigned. Rows for a student who already has 
+        an `Enrollment` in the course are skipped, so existing grades are kept.
+
+        Args:
+            students (Iterable[Tuple[str, str, str]]): The student rows to be added.
+            courses (Iterable[Tuple[str, str]]): The course rows to be added.
+            enrollments (Iterable[Tuple[str, str]]): The (student ID, course ID) pairs to be enrolled.
+
+        Example:
+            >>> sms = StudentManagementSystem()
+            >>> sms.bulk_load([('Ada', 'S1', 'Maths')], [('Algebra', 'C1')], [('S1', 'C1')])
+            >>> sms.students_in_course('C1')
+            ((Ada - Maths),)
+            >>> sms.enrollments
+            []
+            >>> sms.assign_grade('C1', 'S1', 'A')
+            >>> sms.enrollments
+            [(Algebra, Ada, A)]
+            >>> sms.bulk_load(enrollments=[('S1', 'C1')])
+            >>> sms.find_enrollment('C1', 'S1').grade
+            'A'
+        """
+        # Records not already in the system; as with add_student and add_course, 
+        # the first row for an ID wins
+        new_students: Dict[str, Student] = {}
+        for row in students:
+            std = Student(*row)
+            if std.id_number not in self.students:
+                new_students.setdefault(std.id_number, std)
+        new_courses: Dict[str, Course] = {}
+        for row in courses:
+            crs = Course(*row)
+            if crs.course_id not in self.courses:
+                new_courses.setdefault(crs.course_id, crs)
+
+        students_by_course: Dict[str, List[Student]] = {}
+        for student_id, course_id in enrollments:
+            if (course_id, student_id) in self.enrollment_index:
+                continue
+            student_found = self.students.get(student_id, new_students.get(student_id))
+            if student_found is None:
+                raise ValueError(f'No student record found for ID: {student_id}')
+            students_by_course.setdefault(course_id, []).append(student_found)
+        courses_found: Dict[str, Course] = {}
+        for course_id in students_by_course:
+            course_found = self.courses.get(course_id, new_courses.get(course_id))
+            if course_found is None:
+                raise ValueError(f'No course record found for ID: {course_id}')
+            courses_found[course_id] = course_found
+
+        self.students.update(new_students)
+        self.courses.update(new_courses)
+
+        courses_by_student: Dict[Student, List[Course]] = {}
+        for course_id, course_students in students_by_course.items():
+            course_found = courses_found[course_id]
+            course_found.bulk_enroll(course_students)
+            for student_found in course_students:
+                courses_by_student.setdefault(student_found, []).append(course_found)
+                key = (course_found.course_id, student_found.id_number)
+                self._pending_enrollments[key] = (student_found, course_found)
+
+        for student_found, student_courses in courses_by_student.items():
+            student_found.bulk_add_courses(student_courses)
 
     def find_enrollment(self, course_id: str, student_id: str) -> Enrollment:
         """
         Finds an enrollment record for a specific student in a specific course.
 
-        Searches through the list of enrollments to find an `Enrollment` object that matches
-        the provided student ID and course ID.
+        Looks up the enrollment index for the `Enrollment` object that matches
+        the provided student ID and course ID. If the enrollment was loaded by 
+        `bulk_load` and is still pending, its `Enrollment` is created now and added to 
+        the list of enrollments and to the enrollment index. As with enrollments made 
+        by `enroll`, the record is kept even if the student has since been removed 
+        from the course with `Course.remove_student`.
 
         Args:
             course_id (str): The ID of the course to search for.
             student_id (str): The ID of the student to search for.
         """
-        for enrol in self.enrollments:
-            if (enrol.student.id_number == student_id) and (enrol.course.course_id == course_id):
-                return enrol
-        raise ValueError(f'StudentID {student_id} is not enrolled in courseID {course_id}')
+        key = (course_id, student_id)
+        try:
+            return self.enrollment_index[key]
+        except KeyError:
+            pass
+        pending = self._pending_enrollments.pop(key, None)
+        if pending is None:
+            raise ValueError(f'StudentID {student_id} is not enrolled in courseID {course_id}')
+        enrol_obj = Enrollment._from_linked(*pending)
+        self.enrollments.append(enrol_obj)
+        self.enrollment_index[key] = enrol_obj
+        return enrol_obj
 
     def assign_grade(self, course_id: str, student_id: str, grade: str) -> None:
         """
@@ -468,33 +729,58 @@ class StudentManagementSystem:
         enrollment_found = self.find_enrollment(course_id, student_id)
         enrollment_found.assign_grade(grade)
 
-    def students_in_course(self, course_id: str) -> List[Student]:
+    def bulk_assign_grades(self, course_id: str, student_ids: Iterable[str], grades: Iterable[str]) -> None:
+        """
+        Assigns grades to many students in a specific course at once.
+
+        The i-th grade is assigned to the i-th student ID. Every enrollment is looked up 
+        and every grade is validated before any grade is assigned, so if a student is not 
+        enrolled in the course or a grade is invalid, a ValueError is raised and no grades 
+        are changed.
+
+        Args:
+            course_id (str): The ID of the course for which the grades are assigned.
+            student_ids (Iterable[str]): The IDs of the students to whom the grades are assigned.
+            grades (Iterable[str]): The grades to be assigned, in the same order as the student IDs.
+        """
+        student_ids = list(student_ids)
+        grades = list(grades)
+        if len(student_ids) != len(grades):
+            raise ValueError(f'Got {len(student_ids)} student IDs but {len(grades)} grades')
+        if not _VALID_GRADES.issuperset(grades):
+            raise ValueError('Invalid grading system')
+
+        enrollments_found = [self.find_enrollment(course_id, student_id) for student_id in student_ids]
+        for enrollment_found, grade in zip(enrollments_found, grades):
+            enrollment_found.assign_grade(grade)
+
+    def students_in_course(self, course_id: str) -> Tuple[Student, ...]:
         """
-        Retrieves a list of students enrolled in a specific course.
+        Retrieves the students enrolled in a specific course.
 
         This method finds the course by its ID using the `find_course` method. 
-        If the course is found, it returns the list of students enrolled in that course. 
-        If the course is not found, it returns an empty list.
+        If the course is found, it returns the course's cached snapshot of enrolled students, 
+        which is only rebuilt after a student is enrolled in or removed from the course.
 
         Args:
             course_id (str): The ID of the course for which to retrieve the enrolled students.
         """
         course_found = self.find_course(course_id)
-        return course_found.enrolled_students
+        return course_found.students_snapshot
     
-    def student_courses(self, student_id: str) -> List[Course]:
+    def student_courses(self, student_id: str) -> Tuple[Course, ...]:
         """
-        Retrieves a list of courses a student is enrolled in.
+        Retrieves the courses a student is enrolled in.
 
         This method finds the student by their ID using the `find_student` method. 
-        If the student is found, it returns the list of courses the student is enrolled in. 
-        If the student is not found, it returns an empty list.
+        If the student is found, it returns the student's cached snapshot of enrolled courses, 
+        which is only rebuilt after the student is enrolled in a new course.
 
         Args:
             student_id (str): The ID of the student for whom to retrieve the enrolled courses.
         """
         student_found = self.find_student(student_id)
-        return list(student_found.courses.keys())
+        return student_found.courses_snapshot
         
 
 